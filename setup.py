@@ -1,10 +1,24 @@
 # Always prefer setuptools over distutils
-from setuptools import setup
+from setuptools import setup, Extension
 from os import path
 from swg_python import __version__ as VERSION
 
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
 here = path.abspath(path.dirname(__file__))
 
+# When Cython is available the parser module is compiled in place of the pure Python one. The extension is optional, so
+# the installation falls back to the `.py` module if it cannot be built.
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize(
+        [Extension('swg_python.parser', ['swg_python/parser.py'], optional=True)],
+        compiler_directives={'language_level': 3}
+    )
+
 long_description = "For more information see https://github.com/Furkanzmc/swg-python"
 
 setup(
@@ -45,19 +59,20 @@ setup(
 
         # Specify the Python versions you support here. In particular, ensure
         # that you indicate whether you support Python 2, Python 3 or both.
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
+        'Programming Language :: Python :: 3 :: Only',
         'Programming Language :: Python :: 3.5',
     ],
 
+    python_requires='>=3.5',
+
     # What does your project relate to?
     keywords='python swagger python-library python-script',
 
     # You can just specify the packages manually here if your project is
     # simple. Or you can use find_packages().
     packages=['swg_python'],
+    ext_modules=ext_modules,
 
     # Alternatively, if you want to distribute just a my_module.py, uncomment
     # this:
@@ -1,19 +1,243 @@
-import json
+import copy
 import yaml
-import io
 import os
+import re
 import sys
-if sys.version_info[0] < 3:
-    import codecs
+from collections import OrderedDict
+from swg_python import __version__
+
+# `json` and `concurrent.futures` are imported where they are used. Most of the time neither is needed, and together
+# they take longer to import than `yaml`.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
 
 
 swg_python_version = "1.0.5"
 
+_SWG_BEGIN = b'@swg_begin'
+_SWG_END = b'@swg_end'
+# Matches the YAML string wrapped between `@swg_begin` and `@swg_end`
+_SWG_BLOCK_RE = re.compile(re.escape(_SWG_BEGIN) + b'(.*?)' + re.escape(_SWG_END), re.DOTALL)
+# Matches any of the keys that _classify_swg_block() uses. A block without a match is never put into the swagger
+# dictionary, so it does not need to be loaded. False positives are harmless, the block is loaded and checked as usual.
+_SWG_KEY_RE = re.compile(br'''\b(?:definition|method|info)['"]?\s*:''')
+
+
+class _LRUCache:
+    """
+    A dictionary that holds at most `max_size` items. When it is full, the least recently used item is dropped.
+    """
+
+    def __init__(self, max_size):
+        self._items = OrderedDict()
+        self._max_size = max_size
+
+    def get(self, key, default=None):
+        if key not in self._items:
+            return default
+
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def put(self, key, value):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        if len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+
+
+# Loaded and classified swg blocks, keyed by the YAML string of the block. The same block text is often repeated
+# throughout a project and is loaded again on every compile.
+_block_cache = _LRUCache(4096)
+# Classified swg blocks of a file, keyed by the file path and whether errors are ignored. An entry is only used while
+# the modification time and size of the file stay the same.
+_file_cache = _LRUCache(256)
+
+
+def _walk_py_files(directory):
+    """
+    @brief      Walks the given directory in the same order as `os.walk()` and yields a `(subdir, files)` tuple for every
+                directory, where files is the list of `os.DirEntry` objects of the files with the `py` extension. The
+                entries are listed with `os.scandir()`, which gives the entry type without an extra `stat` call. Like
+                `os.walk()`, symbolic links to directories are not followed and unreadable directories are skipped.
+    """
+
+    directories = [directory]
+    while len(directories) > 0:
+        subdir = directories.pop()
+        try:
+            entries = list(os.scandir(subdir))
+        except OSError:
+            continue
+
+        subdirs = []
+        files = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith(".py") and entry.is_file():
+                files.append(entry)
+
+        yield subdir, files
+        directories.extend(reversed(subdirs))
+
+
+def _iter_py_files(directory):
+    """
+    @brief      Yields the path of every file with the `py` extension under the given directory.
+    """
+
+    for subdir, files in _walk_py_files(directory):
+        for entry in files:
+            yield entry.path
+
+
+def _dump_json(data):
+    """
+    @brief      Serializes data to a compact JSON string. `orjson` is used if it is installed, otherwise the standard
+                `json` module is used with the same separators. Data that orjson cannot serialize (e.g. integers
+                outside the 64-bit range) also falls back to `json`. Dates are passed through to that fallback as well,
+                so they raise like they do with `json` alone. The two still differ in how some floats are written:
+                orjson writes `1e20` for `1e+20` and `null` for NaN and infinity.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME).decode('utf-8')
+        except TypeError:
+            pass
+
+    import json
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def _load_json(content):
+    """
+    @brief      Deserializes the JSON string with `orjson` if it is installed, otherwise with the standard `json` module.
+    """
+
+    if orjson is not None:
+        return orjson.loads(content)
+
+    import json
+    return json.loads(content)
+
+
+def _load_swg_block(block, ignore_errors=False):
+    """
+    @brief      Loads the YAML string found between `@swg_begin` and `@swg_end`.
+    @param      block  The YAML string of the block, as UTF-8 encoded bytes
+    @return     The swagger block as a dictionary. If the block is empty, returns None
+    """
+
+    if ignore_errors:
+        try:
+            return yaml.load(block, Loader=_Loader)
+        except:
+            return None
+
+    return yaml.load(block, Loader=_Loader)
+
+
+def _classify_swg_block(block):
+    """
+    @brief      Splits a loaded block into a `(kind, key, block)` tuple. kind is `definition`, `path` or `info`, and key is
+                the definition name, a `(path, method)` tuple or None respectively. The `definition`, `path` and `method`
+                keys are popped from the block, so the block can be put into the swagger dictionary as it is.
+    @return     The tuple, or `(None, None, block)` if the block is none of these
+    """
+
+    if not isinstance(block, dict):
+        return None, None, block
+    elif 'definition' in block:
+        return 'definition', block.pop('definition'), block
+    elif 'method' in block:
+        method_name = block.pop('method')
+        return 'path', (block.pop('path'), method_name), block
+    elif 'info' in block:
+        return 'info', None, block
+
+    return None, None, block
+
+
+def _copy_classified_block(kind, key, block):
+    """
+    @brief      Copies a cached classified block so that putting it into the swagger dictionary cannot change the cache.
+                Definition and path blocks are stored as they are and never modified, so a shallow copy is enough. The
+                nested dictionaries of an info block (e.g. `definitions` and `paths`) become part of the swagger
+                dictionary and the later blocks are put into them, so info blocks are deep copied.
+    """
+
+    if kind == 'info':
+        return kind, key, copy.deepcopy(block)
+
+    return kind, key, dict(block)
+
+
+def _load_swg_blocks(blocks, ignore_errors=False):
+    """
+    @brief      Loads and classifies the given blocks with @ref _classify_swg_block(), using the cached result for the
+                blocks that were loaded before. The blocks are copied with @ref _copy_classified_block() to keep the
+                cache separate from the swagger dictionary.
+    @return     The list of `(kind, key, block)` tuples in the same order as blocks, without the blocks that are none of
+                the known kinds
+    """
+
+    documents = [_block_cache.get(block) for block in blocks]
+    missing = [block for block, document in zip(blocks, documents) if document is None]
+    if len(missing) > 0:
+        loaded = [_classify_swg_block(_load_swg_block(block, ignore_errors)) for block in missing]
+        for block, document in zip(missing, loaded):
+            if document[0] is not None:
+                _block_cache.put(block, document)
+
+        loaded = iter(loaded)
+        documents = [next(loaded) if document is None else document for document in documents]
+
+    return [_copy_classified_block(kind, key, block) for kind, key, block in documents if kind is not None]
+
+
+def _parse_file(file_path, ignore_errors=False):
+    """
+    @brief      Parses the swg blocks of a single file. This does not depend on any parser state so that it can run in
+                a worker process. Files without a `@swg_begin` marker are skipped before any YAML parsing is done. The
+                file is never decoded in Python, the blocks are handed to the YAML loader as UTF-8 encoded bytes.
+    @return     The list of classified swagger blocks, in the order they appear in the file. See @ref _load_swg_blocks().
+    """
+
+    stat = os.stat(file_path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _file_cache.get((file_path, ignore_errors))
+    if cached is not None and cached[0] == version:
+        return [_copy_classified_block(kind, key, block) for kind, key, block in cached[1]]
+
+    with open(file_path, 'rb') as file:
+        file_data = file.read()
+
+    classified_blocks = []
+    if _SWG_BEGIN in file_data:
+        blocks = []
+        for match in _SWG_BLOCK_RE.finditer(file_data):
+            if _SWG_KEY_RE.search(match.group(1)) is not None:
+                blocks.append(match.group(1))
+
+        classified_blocks = _load_swg_blocks(blocks, ignore_errors)
+
+    _file_cache.put((file_path, ignore_errors), (version, classified_blocks))
+    return [_copy_classified_block(kind, key, block) for kind, key, block in classified_blocks]
+
 
 class SwgParser:
     """
     SwgParser is a simple parser that extracts the Swagger API documentation throughout the given folders. It works
-    with both `Python2.7` and `Python 3.x`. The Swagger documentation must be written in YAML format. The specification
+    with `Python 3.5` and later. The Swagger documentation must be written in YAML format. The specification
     is the same as the Swagger specification except a few details.
 
     **Exceptions**
@@ -52,28 +276,42 @@ class SwgParser:
 
     """
 
-    # This is the last end position of the swg block. This index is after the `@swg_end`
-    _last_swg_block_position = 0
-
-    # This is the main dictionary. It will stay the same unless @ref reset() method is called
-    _swagger_dictionary = {}
-    _folders = []
-    _ingore_errors = False
-
-    swagger_dump_yaml = ""
-    swagger_dump_json = ""
-    is_preview_enabled = False
+    __slots__ = (
+        '_swagger_dictionary',
+        '_folders',
+        '_folder_set',
+        '_ingore_errors',
+        'swagger_dump_yaml',
+        'swagger_dump_json',
+        'is_preview_enabled',
+        'max_workers'
+    )
+
+    def __init__(self, enable_preview=True, max_workers=1):
+        """
+        @param      max_workers  The number of processes used to parse the files. When it is greater than 1, the files
+                                 are parsed in parallel with a process pool. If None, one process per CPU is used.
+        """
 
-    def __init__(self, enable_preview=True):
         self.is_preview_enabled = enable_preview
+        self.max_workers = max_workers
+        self._ingore_errors = False
+        # This is the main dictionary. It will stay the same unless @ref reset() method is called
+        self._swagger_dictionary = {}
+        # The list keeps the order the folders are added in, the set is used to check for duplicates
+        self._folders = []
+        self._folder_set = set()
+
+        self.swagger_dump_yaml = ""
+        self.swagger_dump_json = ""
 
     def reset(self):
         """
         @brief      Resets all the parsing information. After this is called, you need to add folders to call the @ref compile() method
         """
-        self._last_swg_block_position = 0
         self._swagger_dictionary = {}
         self._folders = []
+        self._folder_set = set()
 
         self.swagger_dump_yaml = ""
         self.swagger_dump_json = ""
@@ -84,28 +322,46 @@ class SwgParser:
                     If the folder already exists in the list, it is not added again.
         """
 
-        if self._folders.count(folder_path) == 0:
+        if folder_path not in self._folder_set:
+            self._folder_set.add(folder_path)
             self._folders.append(folder_path)
 
-    def compile(self, output_path='', format='yaml', ignore_errors=False):
+    def compile(self, output_path='', format='yaml', ignore_errors=False, use_cache=False):
         """
         @brief      Uses the _folders list to compile the Swagger documentation. If the output_path is provided after compiling the result is written.
+                    If use_cache is True and the output file is written, the result is also stored in `<output_path>.cache.json`
+                    and reused by the next calls until a source file changes.
         """
 
         self._ingore_errors = ignore_errors
-        for folder in self._folders:
-            self.compile_folder(folder)
+        is_output_written = len(output_path) > 0 and os.path.exists(output_path)
+        cache_path = ""
+        modified_time = 0
+        if use_cache and is_output_written:
+            cache_path = "%s.cache.json" % (output_path)
+            # Taken before compiling so that a file edited during the compilation invalidates the written cache.
+            modified_time = self._get_last_modified_time()
+
+        if len(cache_path) == 0 or self._load_cache(cache_path, modified_time) is False:
+            file_paths = []
+            for folder in self._folders:
+                file_paths.extend(_iter_py_files(folder))
+
+            self.compile_files(file_paths)
+
+            self.generate_spec()
+            if len(cache_path) > 0:
+                self._write_cache(cache_path, modified_time)
 
-        self.generate_spec()
         # Now write to the output_path if it's given
-        if len(output_path) > 0 and os.path.exists(output_path):
+        if is_output_written:
             swagger_dump = ""
             if format == 'yaml':
                 swagger_dump = self.swagger_dump_yaml
             else:
                 swagger_dump = self.swagger_dump_json
 
-            self.write_file(output_path, swagger_dump)
+            self.write_file_if_changed(output_path, swagger_dump)
 
         # Now write to the js file
         dump = self.swagger_dump_json
@@ -114,94 +370,130 @@ class SwgParser:
             real_path = os.path.realpath(__file__)
             dir_path = os.path.dirname(real_path)
             js_content = "var SwaggerSpec = %s;" % (dump)
-            self.write_file("%s/static/swg_python/specification.js" % (dir_path), js_content)
-            self.write_file("%s/static/swg_python/specification.json" % (dir_path), dump)
+            self.write_file_if_changed("%s/static/swg_python/specification.js" % (dir_path), js_content)
+            self.write_file_if_changed("%s/static/swg_python/specification.json" % (dir_path), dump)
+
+    def _get_cache_key(self):
+        return [__version__, self._folders, self._ingore_errors]
+
+    def _get_last_modified_time(self):
+        """
+        @brief      Returns the newest modification time of the `py` files and the directories in the _folders list.
+                    Directories are included so that removed files also invalidate the cache.
+        """
+
+        newest = 0
+        for folder in self._folders:
+            for subdir, files in _walk_py_files(folder):
+                newest = max(newest, os.stat(subdir).st_mtime)
+                for entry in files:
+                    newest = max(newest, entry.stat().st_mtime)
+
+        return newest
+
+    def _load_cache(self, cache_path, modified_time):
+        """
+        @brief      Loads the generated specs from the cache file written by @ref _write_cache(). The cache is up to date
+                    if it was written for the same modified_time, see @ref _get_last_modified_time().
+        @return     True if the cache is up to date and loaded, False otherwise.
+        """
+
+        if not os.path.exists(cache_path):
+            return False
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as file:
+                cache = _load_json(file.read())
+        except ValueError:
+            return False
+
+        if cache.get('key') != self._get_cache_key() or cache.get('modified') != modified_time:
+            return False
+
+        self.swagger_dump_yaml = cache['yaml']
+        self.swagger_dump_json = cache['json']
+        if len(self.swagger_dump_json) > 0:
+            self._swagger_dictionary = _load_json(self.swagger_dump_json)
+
+        return True
+
+    def _write_cache(self, cache_path, modified_time):
+        cache = {
+            'key': self._get_cache_key(),
+            'modified': modified_time,
+            'yaml': self.swagger_dump_yaml,
+            'json': self.swagger_dump_json
+        }
+        self.write_file(cache_path, _dump_json(cache))
 
     def compile_folder(self, directory):
         """
         @brief      Compiles a single directory. Only the files with the `py` extension is used.
         """
 
-        for subdir, dirs, files in os.walk(directory):
-            for file in files:
-                filepath = subdir + os.sep + file
-                if filepath.endswith(".py"):
-                    self.compile_swagger_json(filepath)
+        self.compile_files(list(_iter_py_files(directory)))
 
-    def compile_swagger_json(self, file_path):
+    def compile_files(self, file_paths):
         """
-        @brief      Compile a single file
+        @brief      Compiles the given files. If max_workers is greater than 1, the files are parsed in a process pool
+                    and the blocks are put into the swagger dictionary in the order of file_paths.
         """
 
-        self._last_swg_block_position = 0
+        max_workers = self.max_workers
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
 
-        file_content = ""
+        if max_workers < 2 or len(file_paths) < 2:
+            for file_path in file_paths:
+                self.compile_swagger_json(file_path)
+
+            return
 
-        if sys.version_info[0] > 2:
-            file_content = io.open(file_path, 'r', encoding='utf-8').read()
-        else:
-            file_content = codecs.open(filename=file_path, mode='r', encoding='utf-8').read()
+        # Send the files in chunks of up to 16 to cut the IPC overhead, but keep at least a few chunks per worker so
+        # that small projects are still spread over all of them.
+        chunksize = max(1, min(16, len(file_paths) // (max_workers * 4)))
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            ignore_errors = [self._ingore_errors] * len(file_paths)
+            for blocks in executor.map(_parse_file, file_paths, ignore_errors, chunksize=chunksize):
+                for block in blocks:
+                    self._put_classified_block(*block)
 
-        while self.has_next():
-            block = self.get_swg_block(file_content)
-            if block is None:
-                break
+    def compile_swagger_json(self, file_path):
+        """
+        @brief      Compile a single file
+        """
 
-            self.put_definitions(block)
-            self.put_swg_info(block)
-            self.put_swg_path(block)
+        for block in _parse_file(file_path, self._ingore_errors):
+            self._put_classified_block(*block)
 
         return self._swagger_dictionary
 
-    def get_swg_block(self, content):
+    def put_swg_block(self, block):
         """
-        @brief      Finds the block that starts with `@swg_begin` and ends with `@swg_end`
-                    and returns the block within.
-        @param      content  The original content
-        @return     The swagger block as a dictionary. If there is not a swagger block, returns None
+        @brief      Puts the block into the swagger dictionary depending on whether it is a definition, path or info block.
+                    A block is only put once, checked in that order.
         """
 
-        SWG_BEGIN = "@swg_begin"
-        SWG_END = "@swg_end"
-        block_dict = None
+        self._put_classified_block(*_classify_swg_block(block))
 
-        if self._last_swg_block_position > -1:
-            local_content = content[self._last_swg_block_position:]
-            start = local_content.find(SWG_BEGIN)
-            end = local_content.find(SWG_END)
-            self._last_swg_block_position += end + len(SWG_END)
-
-            if self._last_swg_block_position >= len(content) or start == -1 or end == -1:
-                self._last_swg_block_position = -1
-            else:
-                block = local_content[start + len(SWG_BEGIN):end]
-                if self._ingore_errors:
-                    try:
-                        block_dict = yaml.load(block)
-                    except:
-                        pass
-                else:
-                    block_dict = yaml.load(block)
-
-        return block_dict
+    def _put_classified_block(self, kind, key, block):
+        if kind == 'definition':
+            self._swagger_dictionary.setdefault('definitions', {})[key] = block
+        elif kind == 'path':
+            path_name, method_name = key
+            paths = self._swagger_dictionary.setdefault('paths', {})
+            paths.setdefault(path_name, {})[method_name] = block
+        elif kind == 'info':
+            self._swagger_dictionary.update(block)
 
     def put_definitions(self, block):
         """
         @brief      Checks if the block is a definition block and if it is, constructs a definition block and updates the swagger dictionary
         """
 
-        if self.is_swg_definition(block) is False:
-            return
-
-        definition_name = block.get('definition')
-        block.pop('definition')
-        block = {definition_name: block}
-        if self._swagger_dictionary.get('definitions') is not None and self._swagger_dictionary.get('definitions').get(definition_name) is None:
-            self._swagger_dictionary['definitions'].update(block)
-        elif self._swagger_dictionary.get('definitions') is not None:
-            self._swagger_dictionary['definitions'][definition_name] = block.get(definition_name)
-        else:
-            self._swagger_dictionary.update({'definitions': block})
+        if self.is_swg_definition(block):
+            self._put_classified_block('definition', block.pop('definition'), block)
 
     def put_swg_info(self, block):
         """
@@ -209,31 +501,16 @@ class SwgParser:
         """
 
         if self.is_swg_info(block):
-            self._swagger_dictionary.update(block)
+            self._put_classified_block('info', None, block)
 
     def put_swg_path(self, block):
         """
         @brief      If the block is a path block, updates the swagger dictionary.
         """
 
-        if self.is_swg_path(block) is False:
-            return
-
-        method_name = block.get('method')
-        path_name = block.get('path')
-        block.pop('path')
-        block.pop('method')
-
-        if self._swagger_dictionary.get('paths') is not None and self._swagger_dictionary['paths'].get(path_name) is not None:
-            block = {method_name: block}
-            self._swagger_dictionary['paths'][path_name].update(block)
-        elif self._swagger_dictionary.get('paths') is not None:
-            # If the `paths` key exists, but the HTTP method is not yet put here
-            block = {path_name: {method_name: block}}
-            self._swagger_dictionary['paths'].update(block)
-        else:
-            block = {'paths': {path_name: {method_name: block}}}
-            self._swagger_dictionary.update(block)
+        if self.is_swg_path(block):
+            method_name = block.pop('method')
+            self._put_classified_block('path', (block.pop('path'), method_name), block)
 
     def is_swg_definition(self, swg_block):
         """
@@ -242,7 +519,7 @@ class SwgParser:
         @return     True if swg definition, False otherwise.
         """
 
-        return swg_block.get('definition') is not None
+        return 'definition' in swg_block
 
     def is_swg_path(self, swg_block):
         """
@@ -251,7 +528,7 @@ class SwgParser:
         @return     True if swg path, False otherwise.
         """
 
-        return swg_block.get('method') is not None
+        return 'method' in swg_block
 
     def is_swg_info(self, swg_block):
         """
@@ -260,10 +537,7 @@ class SwgParser:
         @return     True if swg root
         """
 
-        return swg_block.get('info') is not None
-
-    def has_next(self):
-        return self._last_swg_block_position > -1
+        return 'info' in swg_block
 
     def generate_spec(self):
         """
@@ -272,18 +546,27 @@ class SwgParser:
         """
 
         if len(self._swagger_dictionary) > 0:
-            self.swagger_dump_yaml = yaml.dump(self._swagger_dictionary)
-            self.swagger_dump_json = json.dumps(self._swagger_dictionary, ensure_ascii=False)
+            self.swagger_dump_yaml = yaml.dump(self._swagger_dictionary, Dumper=_Dumper)
+            self.swagger_dump_json = _dump_json(self._swagger_dictionary)
 
     def write_file(self, file_path, content, encoding='utf8'):
-        if sys.version_info[0] > 2:
-            file = io.open(file_path, 'w', encoding=encoding)
-            file.write(content)
-            file.close()
-        else:
-            file = codecs.open(filename=file_path, mode='w', encoding=encoding)
+        with open(file_path, 'w', encoding=encoding, newline='') as file:
             file.write(content)
-            file.close()
+
+    def write_file_if_changed(self, file_path, content, encoding='utf8'):
+        """
+        @brief      Same as @ref write_file(), but the file is left untouched if it already has the same content. This
+                    way a compile that changes nothing does not trigger file watchers, e.g. the Django autoreloader.
+        """
+
+        data = content.encode(encoding)
+        if os.path.exists(file_path) and os.path.getsize(file_path) == len(data):
+            with open(file_path, 'rb') as file:
+                if file.read() == data:
+                    return
+
+        with open(file_path, 'wb') as file:
+            file.write(data)
 
 
 def command_line_compile(args=None):
@@ -294,6 +577,7 @@ def command_line_compile(args=None):
                 -f: Folder list, separated with space
                 -t: Output type. Default is json. Options are `json` and `yaml`
                 -o: Output full path
+                -j: Number of worker processes. Default is 1
                 -h: Print help message
 
     @return     void
@@ -305,9 +589,11 @@ def command_line_compile(args=None):
     folders = []
     output = ""
     output_type = 'json'
+    max_workers = 1
     is_f_param = False
     is_o_param = False
     is_t_param = False
+    is_j_param = False
     for arg in args:
         if arg == '-h':
             print("""
@@ -315,6 +601,7 @@ swg-python (v%s) is a simple parser that extracts the Swagger API documentation
     -f: Folder list, separated with space
     -t: Output type. Default is json. Options are `json` and `yaml`
     -o: Output full path
+    -j: Number of worker processes. Default is 1
     -h: Print help message
             """ % (swg_python_version))
             break
@@ -322,14 +609,22 @@ swg-python (v%s) is a simple parser that extracts the Swagger API documentation
             is_f_param = True
             is_o_param = False
             is_t_param = False
+            is_j_param = False
         elif arg == '-o':
             is_f_param = False
             is_o_param = True
             is_t_param = False
+            is_j_param = False
         elif arg == '-t':
             is_f_param = False
             is_o_param = False
             is_t_param = True
+            is_j_param = False
+        elif arg == '-j':
+            is_f_param = False
+            is_o_param = False
+            is_t_param = False
+            is_j_param = True
         elif is_f_param:
             folders.append(arg)
         elif is_t_param:
@@ -337,8 +632,11 @@ swg-python (v%s) is a simple parser that extracts the Swagger API documentation
         elif is_o_param:
             output = arg
             is_o_param = False
+        elif is_j_param:
+            max_workers = int(arg)
+            is_j_param = False
 
-    swg_parser = SwgParser(False)
+    swg_parser = SwgParser(False, max_workers)
 
     for folder in folders:
         swg_parser.add_folder(folder)
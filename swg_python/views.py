@@ -1,10 +1,20 @@
 # Django
-from django.shortcuts import render
 from django.conf import settings
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+
+# The templates take no context and do not depend on the request, so each one is rendered once and reused.
+_rendered_templates = {}
+
 
 def render_swagger_view(request):
     redoc_enabled = getattr(settings, 'SWG_ENABLE_REDOC', True)
     if redoc_enabled:
-        return render(request, 'swg_python/redoc.html', {})
+        template_name = 'swg_python/redoc.html'
+    else:
+        template_name = 'swg_python/index.html'
+
+    if template_name not in _rendered_templates:
+        _rendered_templates[template_name] = render_to_string(template_name)
 
-    return render(request, 'swg_python/index.html', {})
+    return HttpResponse(_rendered_templates[template_name])
@@ -1,4 +1,8 @@
-from swg_python import SwgParser
+import json
+import os
+import shutil
+import tempfile
+from swg_python.parser import SwgParser
 
 swg_parser = SwgParser()
 swg_parser.add_folder('./example')
@@ -7,4 +11,125 @@ swg_parser.compile('swagger.json', 'json')
 # Test without the output path
 swg_parser.add_folder('./example')
 swg_parser.compile()
-swg_parser.write_to_file('swagger.yaml', 'yaml')
+swg_parser.write_file('swagger.yaml', swg_parser.swagger_dump_yaml)
+
+# Test that the cached blocks do not keep the definitions and paths put by an earlier compile
+temp_dir = tempfile.mkdtemp()
+with open(os.path.join(temp_dir, 'info.py'), 'w') as file:
+    file.write('''"""
+@swg_begin
+swagger: '2.0'
+info:
+  title: Test
+definitions: {}
+paths: {}
+@swg_end
+"""
+''')
+
+# The files of a folder are compiled before its sub folders, so the info block is always put first
+os.mkdir(os.path.join(temp_dir, 'api'))
+with open(os.path.join(temp_dir, 'api', 'extra.py'), 'w') as file:
+    file.write('''"""
+@swg_begin
+definition: Extra
+type: object
+@swg_end
+
+@swg_begin
+path: /root
+method: post
+responses:
+  default:
+    description: Created
+@swg_end
+"""
+''')
+
+swg_parser = SwgParser(False)
+swg_parser.add_folder(temp_dir)
+swg_parser.compile()
+spec = json.loads(swg_parser.swagger_dump_json)
+assert list(spec['definitions']) == ['Extra']
+assert list(spec['paths']) == ['/root']
+
+os.remove(os.path.join(temp_dir, 'api', 'extra.py'))
+swg_parser = SwgParser(False)
+swg_parser.add_folder(temp_dir)
+swg_parser.compile()
+spec = json.loads(swg_parser.swagger_dump_json)
+assert spec['definitions'] == {}
+assert spec['paths'] == {}
+
+shutil.rmtree(temp_dir)
+
+# Test that block scalars keep the value they have when the block is loaded on its own
+temp_dir = tempfile.mkdtemp()
+with open(os.path.join(temp_dir, 'scalars.py'), 'w') as file:
+    file.write('''"""
+@swg_begin
+definition: Kept
+description: |+
+  hi
+@swg_end
+
+@swg_begin
+definition: Clipped
+description: |
+  hi@swg_end
+"""
+''')
+
+swg_parser = SwgParser(False)
+swg_parser.add_folder(temp_dir)
+swg_parser.compile()
+spec = json.loads(swg_parser.swagger_dump_json)
+assert spec['definitions']['Kept']['description'] == 'hi\n'
+assert spec['definitions']['Clipped']['description'] == 'hi'
+
+shutil.rmtree(temp_dir)
+
+# Test that a compile with use_cache picks up the changes made to the source files after the cache is written
+temp_dir = tempfile.mkdtemp()
+source_path = os.path.join(temp_dir, 'cached.py')
+output_path = os.path.join(temp_dir, 'swagger.json')
+with open(source_path, 'w') as file:
+    file.write('''"""
+@swg_begin
+definition: Cached
+description: Before
+@swg_end
+"""
+''')
+
+# The output file has to exist for the cache to be used
+with open(output_path, 'w') as file:
+    file.write('')
+
+swg_parser = SwgParser(False)
+swg_parser.add_folder(temp_dir)
+swg_parser.compile(output_path, 'json', use_cache=True)
+assert os.path.exists(output_path + '.cache.json')
+with open(output_path, 'r') as file:
+    assert json.loads(file.read())['definitions']['Cached']['description'] == 'Before'
+
+with open(source_path, 'w') as file:
+    file.write('''"""
+@swg_begin
+definition: Cached
+description: After
+@swg_end
+"""
+''')
+
+# Move the modification time forward so that the edit is seen even on file systems with a coarse timestamp resolution
+modified_time = os.path.getmtime(source_path) + 10
+os.utime(source_path, (modified_time, modified_time))
+
+swg_parser = SwgParser(False)
+swg_parser.add_folder(temp_dir)
+swg_parser.compile(output_path, 'json', use_cache=True)
+with open(output_path, 'r') as file:
+    assert json.loads(file.read())['definitions']['Cached']['description'] == 'After'
+
+shutil.rmtree(temp_dir)